@@ -10,7 +10,6 @@ __author__ = "MCP-PBA-TUNNEL Team"
 __description__ = "Standardized AI-Powered Development Workflows"
 
 from .core.config import get_config
-from .server.fastapi_mcp_server import create_app
 
 __all__ = [
     "__version__",
@@ -19,3 +18,11 @@ __all__ = [
     "get_config",
     "create_app"
 ]
+
+
+def __getattr__(name):
+    """Import the server lazily: loading it builds the data manager and connects to the database"""
+    if name == "create_app":
+        from .server.fastapi_mcp_server import create_app
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ import os
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
@@ -21,6 +21,17 @@ class Settings(BaseSettings):
     db_name: str = Field(default="mcp_pba_tunnel")
     db_user: str = Field(default="postgres")
     db_password: str = Field(default="password")
+    # Every worker process has its own pool, so connections add up to web_concurrency × pool size;
+    # db_max_connections is that total and must stay below PostgreSQL's max_connections (default 100)
+    web_concurrency: int = Field(default=1, ge=1)
+    db_max_connections: int = Field(default=80, ge=1)
+    db_pool_min_size: int = Field(default=1)
+    # None derives the per-worker size from db_max_connections // web_concurrency
+    db_pool_max_size: Optional[int] = Field(default=None)
+    db_pool_timeout: float = Field(default=30.0)
+    db_pool_max_lifetime: float = Field(default=3600.0)
+    # Server-side prepare a statement after this many executions on a connection; None disables
+    db_prepare_threshold: Optional[int] = Field(default=2)
 
     # Server
     host: str = Field(default="0.0.0.0")
@@ -51,9 +62,7 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO")
     log_format: str = Field(default="json")
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
 # Global settings instance
@@ -134,6 +143,14 @@ def get_config() -> Dict[str, Any]:
     return config
 
 
+def get_db_pool_max_size() -> int:
+    """Connections per worker pool: DB_POOL_MAX_SIZE, else the connection budget split across workers"""
+    settings = get_settings()
+    if settings.db_pool_max_size is not None:
+        return settings.db_pool_max_size
+    return max(1, settings.db_max_connections // settings.web_concurrency)
+
+
 def get_database_url() -> str:
     """Get PostgreSQL database URL from settings"""
     settings = get_settings()
@@ -4,8 +4,10 @@ AI configuration and model-related data models
 
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
-from uuid import UUID, uuid4
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from uuid import UUID
+
+from ...utils import new_id
 
 
 class AIConfigurationBase(BaseModel):
@@ -16,13 +18,15 @@ class AIConfigurationBase(BaseModel):
     max_tokens: int = Field(default=4000, description="Maximum tokens per request")
     temperature: float = Field(default=0.7, description="Temperature for randomness")
 
-    @validator('max_tokens')
+    @field_validator('max_tokens')
+    @classmethod
     def validate_max_tokens(cls, v):
         if v < 1:
             raise ValueError("max_tokens must be greater than 0")
         return v
 
-    @validator('temperature')
+    @field_validator('temperature')
+    @classmethod
     def validate_temperature(cls, v):
         if not (0 <= v <= 2):
             raise ValueError("temperature must be between 0 and 2")
@@ -46,10 +50,9 @@ class AIConfigurationUpdate(BaseModel):
 
 class AIConfiguration(AIConfigurationBase):
     """Complete AI configuration model"""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     is_active: bool = Field(default=True, description="Whether the configuration is active")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -4,8 +4,10 @@ Prompt chain and execution-related data models
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
-from uuid import UUID, uuid4
+from pydantic import BaseModel, ConfigDict, Field
+from uuid import UUID
+
+from ...utils import new_id
 
 
 class PromptChainStep(BaseModel):
@@ -32,13 +34,12 @@ class PromptChainCreate(PromptChainBase):
 
 class PromptChain(PromptChainBase):
     """Complete prompt chain model"""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     status: str = Field(default="active", description="Status of the chain")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PromptChainExecutionStep(BaseModel):
@@ -66,8 +67,7 @@ class PromptChainExecutionCreate(PromptChainExecutionBase):
 
 class PromptChainExecution(PromptChainExecutionBase):
     """Complete prompt chain execution model"""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
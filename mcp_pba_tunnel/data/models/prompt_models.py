@@ -4,24 +4,35 @@ Prompt-related data models and DTOs
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
-from uuid import UUID, uuid4
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from uuid import UUID
+
+from ...utils import new_id
+from ..validation import TEMPLATE_NAME_MAX_LENGTH, TEMPLATE_NAME_PATTERN, VALID_CATEGORIES
+
+# Built once at import; only used when a category fails validation
+_CATEGORY_ERROR = f"Category must be one of: {sorted(VALID_CATEGORIES)}"
 
 
 class PromptTemplateBase(BaseModel):
     """Base prompt template model"""
-    name: str = Field(..., description="Unique name for the prompt template")
+    name: str = Field(
+        ...,
+        max_length=TEMPLATE_NAME_MAX_LENGTH,
+        pattern=TEMPLATE_NAME_PATTERN,
+        description="Unique name for the prompt template (letters, digits, '_', '.', '-')"
+    )
     description: str = Field(..., description="Description of what this template does")
     category: str = Field(..., description="Category: development, architecture, data, quality, communication")
     template_content: str = Field(..., description="The actual prompt template with variables")
     variables: List[str] = Field(..., description="List of variable names used in the template")
     created_by: str = Field(default="system", description="Who created this template")
 
-    @validator('category')
+    @field_validator('category')
+    @classmethod
     def validate_category(cls, v):
-        valid_categories = ["development", "architecture", "data", "quality", "communication", "techniques"]
-        if v not in valid_categories:
-            raise ValueError(f"Category must be one of: {valid_categories}")
+        if v not in VALID_CATEGORIES:
+            raise ValueError(_CATEGORY_ERROR)
         return v
 
 
@@ -32,32 +43,31 @@ class PromptTemplateCreate(PromptTemplateBase):
 
 class PromptTemplateUpdate(BaseModel):
     """Model for updating a prompt template"""
-    name: Optional[str] = None
+    name: Optional[str] = Field(default=None, max_length=TEMPLATE_NAME_MAX_LENGTH, pattern=TEMPLATE_NAME_PATTERN)
     description: Optional[str] = None
     category: Optional[str] = None
     template_content: Optional[str] = None
     variables: Optional[List[str]] = None
     is_active: Optional[bool] = None
 
-    @validator('category')
+    @field_validator('category')
+    @classmethod
     def validate_category(cls, v):
         if v is not None:
-            valid_categories = ["development", "architecture", "data", "quality", "communication", "techniques"]
-            if v not in valid_categories:
-                raise ValueError(f"Category must be one of: {valid_categories}")
+            if v not in VALID_CATEGORIES:
+                raise ValueError(_CATEGORY_ERROR)
         return v
 
 
 class PromptTemplate(PromptTemplateBase):
     """Complete prompt template model"""
-    id: UUID = Field(default_factory=uuid4, description="Unique identifier")
+    id: UUID = Field(default_factory=new_id, description="Unique identifier")
     version: str = Field(default="1.0.0", description="Template version")
     is_active: bool = Field(default=True, description="Whether the template is active")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PromptUsageBase(BaseModel):
@@ -77,11 +87,10 @@ class PromptUsageCreate(PromptUsageBase):
 
 class PromptUsage(PromptUsageBase):
     """Complete prompt usage model"""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GeneratedContentBase(BaseModel):
@@ -101,11 +110,10 @@ class GeneratedContentCreate(GeneratedContentBase):
 
 class GeneratedContent(GeneratedContentBase):
     """Complete generated content model"""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemoryEntryBase(BaseModel):
@@ -125,8 +133,7 @@ class MemoryEntryCreate(MemoryEntryBase):
 
 class MemoryEntry(MemoryEntryBase):
     """Complete memory entry model"""
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_id)
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -4,8 +4,10 @@ Refactored MCP Prompt Engineering Data Management
 Uses Repository and Service patterns for clean architecture
 """
 
+import glob
 import logging
 import os
+import re
 from typing import Dict, List, Any, Optional
 
 from .models import PromptTemplate
@@ -23,6 +25,9 @@ from .patterns import (
 
 logger = logging.getLogger(__name__)
 
+# SQL line comments stripped from migration files before splitting statements
+_SQL_COMMENT_RE = re.compile(r'--.*$', re.MULTILINE)
+
 
 class DatabaseManager:
     """Database operations manager using psycopg native queries"""
@@ -33,8 +38,6 @@ class DatabaseManager:
 
     def create_tables(self):
         """Create all database tables"""
-        from .repositories.database import DatabaseOperations
-
         # Create all tables
         self._create_prompt_templates_table()
         self._create_prompt_usage_table()
@@ -79,8 +82,6 @@ class DatabaseManager:
 
     def _run_pending_migrations(self, migration_dir: str):
         """Run pending migrations"""
-        import glob
-
         # Get applied migrations
         applied_query = "SELECT version FROM schema_migrations ORDER BY applied_at"
         applied_results = DatabaseOperations.execute_query(applied_query, fetch="all")
@@ -127,10 +128,8 @@ class DatabaseManager:
 
     def _split_sql_statements(self, sql_content: str) -> List[str]:
         """Split SQL content into individual statements"""
-        import re
-
         # Remove comments and split on semicolons
-        sql_content = re.sub(r'--.*$', '', sql_content, flags=re.MULTILINE)
+        sql_content = _SQL_COMMENT_RE.sub('', sql_content)
         statements = []
 
         current_statement = ""
@@ -414,6 +413,22 @@ Format as a database design document with SQL examples.
         """Render a prompt template with variables"""
         return self.prompt_service.render_template(template_name, variables)
 
+    def create_prompt_template(self, name: str, description: str, category: str, template_content: str, variables: List[str], created_by: str = "system") -> str:
+        """Create a prompt template and return its id"""
+        template = self.prompt_service.create_template({
+            "name": name,
+            "description": description,
+            "category": category,
+            "template_content": template_content,
+            "variables": variables,
+            "created_by": created_by
+        })
+        return str(template.id)
+
+    def get_template_by_name(self, name: str) -> Optional[PromptTemplate]:
+        """Get an active prompt template by name"""
+        return self.prompt_service.get_template_by_name(name)
+
     def list_templates(self, category: Optional[str] = None) -> List[PromptTemplate]:
         """List all active prompt templates"""
         return self.prompt_service.list_templates(category)
@@ -550,7 +565,7 @@ Please execute this prompt chain step by step.
 
     def get_ai_configurations(self) -> List[Dict[str, Any]]:
         """Get all AI model configurations"""
-        return [config.dict() for config in self.ai_service.list_configurations()]
+        return [config.model_dump() for config in self.ai_service.list_configurations()]
 
     def create_ai_configuration(self, model_name: str, provider: str, api_base_url: str = None, max_tokens: int = 4000, temperature: float = 0.7) -> str:
         """Create a new AI configuration"""
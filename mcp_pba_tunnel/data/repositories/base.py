@@ -2,7 +2,7 @@
 Base repository classes and interfaces
 """
 
-import json
+import orjson
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, TypeVar, Generic, Protocol
 from datetime import datetime
@@ -21,14 +21,14 @@ class BaseRepository(Generic[T], DatabaseOperations):
 
     def _serialize_json(self, data: Any) -> str:
         """Serialize data to JSON"""
-        return json.dumps(data) if data is not None else None
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode() if data is not None else None
 
     def _deserialize_json(self, data) -> Any:
         """Deserialize JSON data or return if already deserialized"""
         if data is None:
             return None
-        elif isinstance(data, str):
-            return json.loads(data)
+        elif isinstance(data, (str, bytes)):
+            return orjson.loads(data)
         else:
             # Already deserialized (e.g., psycopg2 converted JSON to Python objects)
             return data
@@ -8,7 +8,7 @@ import threading
 from contextlib import contextmanager
 from typing import Generator, Optional
 
-from ...core.config import get_database_url
+from ...core.config import get_database_url, get_db_pool_max_size, get_settings
 
 
 class DatabaseConfig:
@@ -24,12 +24,17 @@ class DatabaseConfig:
             with cls._pool_lock:
                 if cls._pool is None:
                     database_url = get_database_url()
+                    settings = get_settings()
                     pool_kwargs = {
                         "conninfo": database_url,
-                        "min_size": 5,
-                        "max_size": 20,
-                        "timeout": 30,
+                        "min_size": min(settings.db_pool_min_size, get_db_pool_max_size()),
+                        "max_size": get_db_pool_max_size(),
+                        "timeout": settings.db_pool_timeout,
+                        "max_lifetime": settings.db_pool_max_lifetime,
                         "num_workers": 3,
+                        # Ping connections on checkout so dead ones are replaced instead of failing mid-request
+                        "check": psycopg_pool.ConnectionPool.check_connection,
+                        "kwargs": {"prepare_threshold": settings.db_prepare_threshold},
                     }
 
                     # PostgreSQL configuration
@@ -49,16 +54,10 @@ class DatabaseConfig:
     @contextmanager
     def get_connection(cls) -> Generator[psycopg.Connection, None, None]:
         """Get database connection from pool"""
-        pool = cls.get_connection_pool()
-        conn = pool.getconn()
-        try:
+        # pool.connection() commits on success, rolls back on error and always returns the
+        # connection to the shared pool
+        with cls.get_connection_pool().connection() as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            pool.putconn(conn)
 
 
 class DatabaseOperations:
@@ -4,11 +4,47 @@ Repository for prompt template operations
 
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-import json
 
 from .base import BaseRepository
+from ...utils import new_id
 from ..models import PromptTemplate, PromptUsage, GeneratedContent, MemoryEntry
 
+# Hot read queries are module constants so every call sends the identical statement,
+# letting psycopg reuse its prepared form on each pooled connection
+_TEMPLATE_COLUMNS = """
+        SELECT id, name, description, category, template_content, variables,
+               version, is_active, created_at, updated_at, created_by
+        FROM prompt_templates"""
+
+GET_TEMPLATE_BY_ID_QUERY = _TEMPLATE_COLUMNS + """
+        WHERE id = %s AND is_active = true
+        """
+
+GET_TEMPLATE_BY_NAME_QUERY = _TEMPLATE_COLUMNS + """
+        WHERE name = %s AND is_active = true
+        """
+
+LIST_TEMPLATES_BY_CATEGORY_QUERY = """
+        SELECT id, name, description, category, template_content, variables
+        FROM prompt_templates
+        WHERE is_active = true AND category = %s
+        ORDER BY name
+        """
+
+LIST_TEMPLATES_QUERY = """
+        SELECT id, name, description, category, template_content, variables
+        FROM prompt_templates
+        WHERE is_active = true
+        ORDER BY category, name
+        """
+
+LIST_CATEGORIES_QUERY = """
+        SELECT DISTINCT category
+        FROM prompt_templates
+        WHERE is_active = true AND category IS NOT NULL
+        ORDER BY category
+        """
+
 
 class PromptTemplateRepository(BaseRepository[PromptTemplate]):
     """Repository for prompt template database operations"""
@@ -38,14 +74,7 @@ class PromptTemplateRepository(BaseRepository[PromptTemplate]):
 
     def get_by_id(self, template_id: UUID) -> Optional[Dict[str, Any]]:
         """Get a prompt template by ID"""
-        query = """
-        SELECT id, name, description, category, template_content, variables,
-               version, is_active, created_at, updated_at, created_by
-        FROM prompt_templates
-        WHERE id = %s AND is_active = true
-        """
-
-        result = self.execute_query(query, (str(template_id),), fetch="one")
+        result = self.execute_query(GET_TEMPLATE_BY_ID_QUERY, (str(template_id),), fetch="one")
         if result:
             return {
                 "id": UUID(result[0]),
@@ -64,14 +93,7 @@ class PromptTemplateRepository(BaseRepository[PromptTemplate]):
 
     def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a prompt template by name"""
-        query = """
-        SELECT id, name, description, category, template_content, variables,
-               version, is_active, created_at, updated_at, created_by
-        FROM prompt_templates
-        WHERE name = %s AND is_active = true
-        """
-
-        result = self.execute_query(query, (name,), fetch="one")
+        result = self.execute_query(GET_TEMPLATE_BY_NAME_QUERY, (name,), fetch="one")
         if result:
             return {
                 "id": UUID(result[0]),
@@ -91,23 +113,9 @@ class PromptTemplateRepository(BaseRepository[PromptTemplate]):
     def list_all(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all active prompt templates"""
         if category:
-            query = """
-            SELECT id, name, description, category, template_content, variables
-            FROM prompt_templates
-            WHERE is_active = true AND category = %s
-            ORDER BY name
-            """
-            params = (category,)
+            results = self.execute_query(LIST_TEMPLATES_BY_CATEGORY_QUERY, (category,), fetch="all")
         else:
-            query = """
-            SELECT id, name, description, category, template_content, variables
-            FROM prompt_templates
-            WHERE is_active = true
-            ORDER BY category, name
-            """
-            params = None
-
-        results = self.execute_query(query, params, fetch="all")
+            results = self.execute_query(LIST_TEMPLATES_QUERY, fetch="all")
         return [
             {
                 "id": UUID(row[0]),
@@ -154,14 +162,7 @@ class PromptTemplateRepository(BaseRepository[PromptTemplate]):
 
     def get_categories(self) -> List[str]:
         """Get all available prompt categories"""
-        query = """
-        SELECT DISTINCT category
-        FROM prompt_templates
-        WHERE is_active = true AND category IS NOT NULL
-        ORDER BY category
-        """
-
-        results = self.execute_query(query, fetch="all")
+        results = self.execute_query(LIST_CATEGORIES_QUERY, fetch="all")
         return [row[0] for row in results if row[0]]
 
 
@@ -198,7 +199,7 @@ class PromptUsageRepository(BaseRepository[PromptUsage]):
             self.execute_update(update_query, (new_usage_count, new_success_count, new_avg_response_time, usage_id))
         else:
             # Create new usage record
-            usage_id = str(UUID(uuid4().hex))
+            usage_id = str(new_id())
             insert_query = """
             INSERT INTO prompt_usage (id, prompt_id, ai_model, usage_count, success_count, avg_response_time)
             VALUES (%s, %s, %s, %s, %s, %s)
@@ -208,45 +209,28 @@ class PromptUsageRepository(BaseRepository[PromptUsage]):
 
     def get_usage_statistics(self) -> Dict[str, Any]:
         """Get comprehensive usage statistics"""
-        # Get all active templates
-        templates_query = """
-        SELECT id, name
-        FROM prompt_templates
-        WHERE is_active = true
+        # One aggregate query over all active templates instead of a usage query per template
+        usage_query = """
+        SELECT t.name,
+               COALESCE(SUM(u.usage_count), 0),
+               COALESCE(SUM(u.success_count), 0),
+               COALESCE(array_agg(DISTINCT u.ai_model) FILTER (WHERE u.id IS NOT NULL), '{}')
+        FROM prompt_templates t
+        LEFT JOIN prompt_usage u ON u.prompt_id = t.id
+        WHERE t.is_active = true
+        GROUP BY t.id, t.name
         """
 
-        templates = self.execute_query(templates_query, fetch="all")
+        results = self.execute_query(usage_query, fetch="all")
 
-        stats = {}
-        for template_id, template_name in templates:
-            # Get usage statistics for this template
-            usage_query = """
-            SELECT ai_model, SUM(usage_count), SUM(success_count)
-            FROM prompt_usage
-            WHERE prompt_id = %s
-            GROUP BY ai_model
-            """
-
-            usage_results = self.execute_query(usage_query, (template_id,), fetch="all")
-
-            total_usage = 0
-            total_success = 0
-            ai_models = []
-
-            for ai_model, usage_count, success_count in usage_results:
-                total_usage += usage_count
-                total_success += success_count
-                ai_models.append(ai_model)
-
-            success_rate = (total_success / total_usage * 100) if total_usage > 0 else 0
-
-            stats[template_name] = {
+        return {
+            template_name: {
                 "total_usage": total_usage,
-                "success_rate": success_rate,
-                "ai_models": ai_models
+                "success_rate": (total_success / total_usage * 100) if total_usage > 0 else 0,
+                "ai_models": list(ai_models)
             }
-
-        return stats
+            for template_name, total_usage, total_success, ai_models in results
+        }
 
 
 class GeneratedContentRepository(BaseRepository[GeneratedContent]):
@@ -4,6 +4,15 @@ Data validation utilities for the MCP Prompt Engineering System
 
 from typing import Dict, Any, List
 
+# Allowed prompt template categories
+VALID_CATEGORIES = frozenset({
+    "development", "architecture", "data", "quality", "communication", "techniques"
+})
+
+# Template names are identifiers used in tool arguments and URLs; prompt_templates.name is VARCHAR(255)
+TEMPLATE_NAME_PATTERN = r"^[A-Za-z0-9_.-]+$"
+TEMPLATE_NAME_MAX_LENGTH = 255
+
 
 class DataValidator:
     """Data validation utilities"""
@@ -25,9 +34,8 @@ class DataValidator:
             errors.append("Variables must be a list")
 
         if "category" in data:
-            valid_categories = ["development", "architecture", "data", "quality", "communication", "techniques"]
-            if data["category"] not in valid_categories:
-                errors.append(f"Invalid category. Must be one of: {valid_categories}")
+            if data["category"] not in VALID_CATEGORIES:
+                errors.append(f"Invalid category. Must be one of: {sorted(VALID_CATEGORIES)}")
 
         return errors
 
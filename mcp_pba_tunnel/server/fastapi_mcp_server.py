@@ -5,23 +5,36 @@ FastAPI-based MCP server for standardized prompt engineering templates and AI ag
 """
 
 import os
-import json
 import asyncio
 import logging
-import uuid
-from typing import Dict, List, Any, Optional
+import secrets
+import time
+import urllib.parse
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Type, TypeVar, Union
 from datetime import datetime
 from pathlib import Path
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+import fastjsonschema
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.orm import Session
 
+from ..core.config import get_db_pool_max_size, get_settings
+
 # Import our data management system
 from ..data.project_manager import get_data_manager
-from ..data.validation import DataValidator
+from ..data.models import PromptTemplateCreate
+from ..data.validation import TEMPLATE_NAME_MAX_LENGTH, TEMPLATE_NAME_PATTERN
 
 # Configure logging
 logging.basicConfig(
@@ -34,136 +47,350 @@ logger = logging.getLogger(__name__)
 data_manager = get_data_manager()
 
 # Pydantic models for API
-class PromptTemplateRequest(BaseModel):
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+class PromptTemplateRequest(PromptTemplateCreate):
     """Request model for creating prompt templates"""
-    name: str = Field(..., description="Unique name for the prompt template")
-    description: str = Field(..., description="Description of what this template does")
-    category: str = Field(..., description="Category: development, architecture, data, quality, communication")
-    template_content: str = Field(..., description="The actual prompt template with variables")
-    variables: List[str] = Field(..., description="List of variable names used in the template")
-    created_by: str = Field(default="system", description="Who created this template")
-
-    @validator('category')
-    def validate_category(cls, v):
-        valid_categories = ["development", "architecture", "data", "quality", "communication", "techniques"]
-        if v not in valid_categories:
-            raise ValueError(f"Category must be one of: {valid_categories}")
-        return v
 
 class PromptRenderRequest(BaseModel):
     """Request model for rendering prompt templates"""
     template_name: str = Field(..., description="Name of the template to render")
     variables: Dict[str, Any] = Field(..., description="Variables to substitute in the template")
 
+class JsonRpcRequest(BaseModel):
+    """JSON-RPC 2.0 request envelope for MCP endpoints"""
+    model_config = ConfigDict(extra="forbid")
+
+    jsonrpc: Literal["2.0"] = Field(default="2.0", description="JSON-RPC protocol version")
+    id: Optional[Union[str, int]] = Field(default=None, description="Request identifier echoed in the response")
+    method: str = Field(..., description="MCP method name, e.g. tools/call")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Method parameters")
+
+class ListRequest(JsonRpcRequest):
+    """JSON-RPC request for prompts/list and tools/list; the endpoint fixes the method, so it is optional"""
+    method: Optional[str] = Field(default=None, description="MCP method name, ignored by list endpoints")
+
+class PromptGetParams(BaseModel):
+    """Parameters for the prompts/get method"""
+    name: str = Field(..., min_length=1, max_length=TEMPLATE_NAME_MAX_LENGTH, description="Name of the prompt template")
+
+class ToolCallParams(BaseModel):
+    """Parameters for the tools/call method"""
+    name: str = Field(..., min_length=1, description="Name of the tool to call")
+    arguments: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
+
+class PromptGetRequest(JsonRpcRequest):
+    """JSON-RPC request for prompts/get"""
+    params: PromptGetParams
+
+class ToolCallRequest(JsonRpcRequest):
+    """JSON-RPC request for tools/call"""
+    params: ToolCallParams
+
+RpcT = TypeVar("RpcT", bound=JsonRpcRequest)
+
+# Built once at import so request bodies are parsed and validated in a single pydantic-core pass
+_RPC_ADAPTERS: Dict[Type[JsonRpcRequest], TypeAdapter] = {
+    model: TypeAdapter(model) for model in (JsonRpcRequest, ListRequest, PromptGetRequest, ToolCallRequest)
+}
+
+def _format_validation_errors(error: ValidationError) -> List[str]:
+    """Flatten pydantic validation errors into "field: message" strings"""
+    return [
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in error.errors()
+    ]
+
+def rpc_body(model: Type[RpcT]) -> Callable[[Request], Awaitable[RpcT]]:
+    """Dependency that parses and validates a JSON-RPC request body straight from the raw bytes"""
+    adapter = _RPC_ADAPTERS[model]
+    # Models without required fields (the list requests) treat an empty body as all defaults
+    allow_empty = not any(field.is_required() for field in model.model_fields.values())
+
+    async def parse_rpc_request(request: Request) -> RpcT:
+        body = await request.body()
+        if allow_empty and not body.strip():
+            return model()
+        try:
+            return adapter.validate_json(body)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid JSON-RPC request: {_format_validation_errors(e)}"
+            )
+
+    return parse_rpc_request
+
+def json_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """Dependency that parses and validates a JSON body with model_validate_json in one pass"""
+    async def parse_body(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)
+            ])
+    return parse_body
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that read their body through json_body()"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+# Cached ISO timestamp for hot endpoints, refreshed by the lifespan ticker
+TIMESTAMP_TICK_SECONDS = 1.0
+_cached_timestamp: Optional[str] = None
+_cached_health_body: Optional[bytes] = None
+
+def _health_body(timestamp: str) -> bytes:
+    """Encode the /health payload for the given timestamp"""
+    return orjson.dumps({
+        "status": "healthy",
+        "timestamp": timestamp,
+        "service": "mcp-prompt-engineering-server",
+        "version": "1.0.0"
+    })
+
+async def _timestamp_ticker():
+    """Refresh the cached timestamp and pre-encoded /health body once per tick"""
+    global _cached_timestamp, _cached_health_body
+    while True:
+        _cached_timestamp = datetime.utcnow().isoformat()
+        _cached_health_body = _health_body(_cached_timestamp)
+        await asyncio.sleep(TIMESTAMP_TICK_SECONDS)
+
+def current_timestamp() -> str:
+    """Return the cached timestamp, or a fresh one when the ticker is not running"""
+    return _cached_timestamp or datetime.utcnow().isoformat()
+
+# Pre-encoded JSON-RPC envelope fragments; only the id and result are serialized per call
+_RPC_ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RPC_RESULT_KEY = b',"result":'
+
+def rpc_response_raw(request_id: Any, result_body: bytes) -> Response:
+    """Build a JSON-RPC 2.0 success response around an already-encoded result"""
+    body = b"".join((
+        _RPC_ENVELOPE_PREFIX,
+        orjson.dumps(request_id),
+        _RPC_RESULT_KEY,
+        result_body,
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
+
+def rpc_response(request_id: Any, result: Dict[str, Any]) -> Response:
+    """Build a JSON-RPC 2.0 success response without re-encoding the envelope"""
+    return rpc_response_raw(request_id, orjson.dumps(result))
+
+# JSON-RPC 2.0 error codes used when reporting per-request failures in a batch
+JSONRPC_INVALID_REQUEST = -32600
+JSONRPC_METHOD_NOT_FOUND = -32601
+JSONRPC_INVALID_PARAMS = -32602
+JSONRPC_INTERNAL_ERROR = -32603
+
+def rpc_error_body(request_id: Any, code: int, message: str) -> bytes:
+    """Encode a JSON-RPC 2.0 error object"""
+    return orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message}
+    })
+
+@lru_cache(maxsize=1024)
+def _prompt_arguments(variables: Tuple[str, ...]) -> orjson.Fragment:
+    """Build the MCP argument list for template variables, pre-encoded and memoized"""
+    return orjson.Fragment(orjson.dumps([
+        {
+            "name": var,
+            "description": f"Variable: {var}",
+            "required": True
+        }
+        for var in variables
+    ]))
+
+def get_thread_pool_size() -> int:
+    """Worker threads for blocking calls: THREAD_POOL_SIZE, else 8 per CPU capped at 64 and at the DB pool size"""
+    # Blocking calls are database calls, so threads beyond the pool size would only queue on it
+    default_size = min(64, (os.cpu_count() or 4) * 8, get_db_pool_max_size())
+    return int(os.getenv("THREAD_POOL_SIZE", str(default_size)))
+
+# Templates change only through create_prompt_template, which invalidates these caches in the
+# worker that handled the write. Other workers keep serving their copy until the TTL expires, so
+# the default TTL is short when several workers run
+TEMPLATE_CACHE_TTL_SECONDS = float(
+    os.getenv("TEMPLATE_CACHE_TTL", "30" if get_settings().web_concurrency == 1 else "5")
+)
+_template_list_cache: Optional[Tuple[float, List[Any]]] = None
+_template_cache: Dict[str, Tuple[float, Any]] = {}
+_template_list_lock = asyncio.Lock()
+# Bumped on every invalidation; a load that started before a write must not store its stale result
+_template_cache_generation = 0
+
+async def get_cached_templates() -> List[Any]:
+    """Return all templates, reloading from the database once the TTL has expired"""
+    global _template_list_cache
+    cached = _template_list_cache
+    if cached and time.monotonic() - cached[0] < TEMPLATE_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    async with _template_list_lock:
+        cached = _template_list_cache
+        if cached and time.monotonic() - cached[0] < TEMPLATE_CACHE_TTL_SECONDS:
+            return cached[1]
+        generation = _template_cache_generation
+        templates = await asyncio.to_thread(data_manager.list_templates)
+        if generation == _template_cache_generation:
+            _template_list_cache = (time.monotonic(), templates)
+        return templates
+
+async def get_cached_template(name: str) -> Any:
+    """Return a template by name, caching hits for the TTL"""
+    cached = _template_cache.get(name)
+    if cached and time.monotonic() - cached[0] < TEMPLATE_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    generation = _template_cache_generation
+    template = await asyncio.to_thread(data_manager.get_template_by_name, name)
+    if template and generation == _template_cache_generation:
+        _template_cache[name] = (time.monotonic(), template)
+    return template
+
+def invalidate_template_cache():
+    """Drop cached templates after a write"""
+    global _template_list_cache, _template_cache_generation
+    _template_cache_generation += 1
+    _template_list_cache = None
+    _template_cache.clear()
+
+# Usage statistics tolerate brief staleness; cache the aggregate for STATS_CACHE_TTL seconds
+STATS_CACHE_TTL_SECONDS = float(os.getenv("STATS_CACHE_TTL", "30"))
+_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+async def get_cached_usage_statistics() -> Dict[str, Any]:
+    """Return usage statistics, re-querying once the TTL has expired"""
+    global _stats_cache
+    cached = _stats_cache
+    if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    stats = await asyncio.to_thread(data_manager.get_usage_statistics)
+    _stats_cache = (time.monotonic(), stats)
+    return stats
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 # FastAPI app setup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle"""
     # Startup
     logger.info("Starting MCP Prompt Engineering Server")
-    logger.info("Available categories: " + ", ".join(data_manager.get_available_categories()))
+
+    # Size the default executor used by asyncio.to_thread for blocking DB calls, and give
+    # FastAPI's own run_in_threadpool (sync dependencies, background tasks) the same capacity
+    thread_pool_size = get_thread_pool_size()
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=thread_pool_size, thread_name_prefix="mcp-db")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = thread_pool_size
+
+    categories = await asyncio.to_thread(data_manager.get_available_categories)
+    logger.info("Available categories: " + ", ".join(categories))
+
+    ticker = asyncio.create_task(_timestamp_ticker())
 
     yield
 
     # Shutdown
+    global _cached_timestamp, _cached_health_body
+    ticker.cancel()
+    _cached_timestamp = None
+    _cached_health_body = None
     logger.info("Shutting down MCP Prompt Engineering Server")
 
 app = FastAPI(
     title="MCP Prompt Engineering Server",
     description="MCP server for standardized prompt engineering templates and AI agent integration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for cross-origin requests
+# Explicit CORS policy; set CORS_ORIGINS to restrict origins in production. Credentials stay
+# off (wildcard + credentials is invalid per spec) and preflights are cacheable for a day
+CORS_ALLOWED_ORIGINS = tuple(get_settings().cors_origins)
+CORS_ALLOWED_METHODS = ("GET", "POST")
+CORS_ALLOWED_HEADERS = ("content-type", "authorization")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ALLOWED_ORIGINS,
+    allow_credentials=False,
+    allow_methods=CORS_ALLOWED_METHODS,
+    allow_headers=CORS_ALLOWED_HEADERS,
+    max_age=86400,
 )
 
+# Compress larger JSON payloads (tool lists, template listings, statistics)
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "service": "mcp-prompt-engineering-server",
-        "version": "1.0.0"
-    }
+    body = _cached_health_body or _health_body(current_timestamp())
+    return Response(content=body, media_type="application/json")
 
 # MCP Protocol Endpoints
 
 @app.post("/mcp/prompts/list")
-async def list_prompts(request: Dict[str, Any] = None):
+async def list_prompts(request: ListRequest = Depends(rpc_body(ListRequest))):
     """List available prompt templates (MCP protocol)"""
     try:
-        templates = data_manager.list_templates()
+        templates = await get_cached_templates()
 
         prompts = []
         for template in templates:
             prompts.append({
                 "name": template.name,
                 "description": template.description,
-                "arguments": [
-                    {
-                        "name": var,
-                        "description": f"Variable: {var}",
-                        "required": True
-                    }
-                    for var in template.variables or []
-                ]
+                "arguments": _prompt_arguments(tuple(template.variables or ()))
             })
 
-        return {
-            "jsonrpc": "2.0",
-            "id": request.get("id") if request else None,
-            "result": {
-                "prompts": prompts
-            }
-        }
+        return rpc_response(request.id, {
+            "prompts": prompts
+        })
 
     except Exception as e:
         logger.error(f"Error listing prompts: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/mcp/prompts/get")
-async def get_prompt(request: Dict[str, Any]):
+async def get_prompt(request: PromptGetRequest = Depends(rpc_body(PromptGetRequest))):
     """Get a specific prompt template (MCP protocol)"""
     try:
-        params = request.get("params", {})
-        template_name = params.get("name")
-
-        if not template_name:
-            raise HTTPException(status_code=400, detail="Template name is required")
-
-        template = data_manager.get_template_by_name(template_name)
+        template_name = request.params.name
+        template = await get_cached_template(template_name)
 
         if not template:
             raise HTTPException(status_code=404, detail=f"Template not found: {template_name}")
 
-        return {
-            "jsonrpc": "2.0",
-            "id": request.get("id"),
-            "result": {
-                "prompt": {
-                    "name": template.name,
-                    "description": template.description,
-                    "content": template.template_content,
-                    "arguments": [
-                        {
-                            "name": var,
-                            "description": f"Variable: {var}",
-                            "required": True
-                        }
-                        for var in template.variables or []
-                    ]
-                }
+        return rpc_response(request.id, {
+            "prompt": {
+                "name": template.name,
+                "description": template.description,
+                "content": template.template_content,
+                "arguments": _prompt_arguments(tuple(template.variables or ()))
             }
-        }
+        })
 
     except HTTPException:
         raise
@@ -171,326 +398,335 @@ async def get_prompt(request: Dict[str, Any]):
         logger.error(f"Error getting prompt: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/mcp/tools/list")
-async def list_tools(request: Dict[str, Any] = None):
-    """List available tools (MCP protocol)"""
-    try:
-        tools = [
-            {
-                "name": "render_prompt",
-                "description": "Render a prompt template with variables",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "template_name": {"type": "string"},
-                        "variables": {"type": "object"}
-                    },
-                    "required": ["template_name", "variables"]
-                }
+# Leaf schemas shared by every tool's inputSchema instead of one dict per property
+_STRING_SCHEMA = {"type": "string"}
+_OBJECT_SCHEMA = {"type": "object"}
+_ARRAY_SCHEMA = {"type": "array"}
+_BOOLEAN_SCHEMA = {"type": "boolean"}
+_STRING_ARRAY_SCHEMA = {"type": "array", "items": _STRING_SCHEMA}
+# Same name rule as PromptTemplateBase.name, so render never rejects a name that create accepted
+_TEMPLATE_NAME_SCHEMA = {"type": "string", "pattern": TEMPLATE_NAME_PATTERN, "maxLength": TEMPLATE_NAME_MAX_LENGTH}
+
+# Static MCP tool catalog; the tools/list result is encoded once at import
+MCP_TOOLS = [
+    {
+        "name": "render_prompt",
+        "description": "Render a prompt template with variables",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "template_name": _TEMPLATE_NAME_SCHEMA,
+                "variables": _OBJECT_SCHEMA
             },
-            {
-                "name": "create_prompt_template",
-                "description": "Create a new prompt template",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "description": {"type": "string"},
-                        "category": {"type": "string"},
-                        "template_content": {"type": "string"},
-                        "variables": {"type": "array", "items": {"type": "string"}}
-                    },
-                    "required": ["name", "description", "category", "template_content", "variables"]
-                }
+            "required": ["template_name", "variables"]
+        }
+    },
+    {
+        "name": "create_prompt_template",
+        "description": "Create a new prompt template",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": _TEMPLATE_NAME_SCHEMA,
+                "description": _STRING_SCHEMA,
+                "category": _STRING_SCHEMA,
+                "template_content": _STRING_SCHEMA,
+                "variables": _STRING_ARRAY_SCHEMA
             },
-            {
-                "name": "memory_be",
-                "description": "Backend memory management for conversation history",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {"type": "string", "enum": ["store", "retrieve", "clear"]},
-                        "conversation_id": {"type": "string"},
-                        "session_id": {"type": "string"},
-                        "data": {"type": "object"}
-                    },
-                    "required": ["operation", "conversation_id"]
-                }
+            "required": ["name", "description", "category", "template_content", "variables"]
+        }
+    },
+    {
+        "name": "memory_be",
+        "description": "Backend memory management for conversation history",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "operation": {"type": "string", "enum": ["store", "retrieve", "clear"]},
+                "conversation_id": _STRING_SCHEMA,
+                "session_id": _STRING_SCHEMA,
+                "data": _OBJECT_SCHEMA
             },
-            {
-                "name": "memory_fe",
-                "description": "Frontend memory interface for UI interactions",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "action": {"type": "string", "enum": ["get_history", "save_context"]},
-                        "session_id": {"type": "string"}
-                    },
-                    "required": ["action", "session_id"]
-                }
+            "required": ["operation", "conversation_id"]
+        }
+    },
+    {
+        "name": "memory_fe",
+        "description": "Frontend memory interface for UI interactions",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "action": {"type": "string", "enum": ["get_history", "save_context"]},
+                "session_id": _STRING_SCHEMA
             },
-            {
-                "name": "prompt_chain_be",
-                "description": "Backend prompt chaining for complex workflows",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "chain_id": {"type": "string"},
-                        "steps": {"type": "array"},
-                        "inputs": {"type": "object"}
-                    },
-                    "required": ["chain_id", "steps"]
-                }
+            "required": ["action", "session_id"]
+        }
+    },
+    {
+        "name": "prompt_chain_be",
+        "description": "Backend prompt chaining for complex workflows",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "chain_id": _STRING_SCHEMA,
+                "steps": _ARRAY_SCHEMA,
+                "inputs": _OBJECT_SCHEMA
             },
-            {
-                "name": "prompt_chain_fe",
-                "description": "Frontend prompt chain visualization",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "chain_id": {"type": "string"},
-                        "visualize": {"type": "boolean"}
-                    },
-                    "required": ["chain_id"]
-                }
+            "required": ["chain_id", "steps"]
+        }
+    },
+    {
+        "name": "prompt_chain_fe",
+        "description": "Frontend prompt chain visualization",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "chain_id": _STRING_SCHEMA,
+                "visualize": _BOOLEAN_SCHEMA
             },
-            {
-                "name": "render_technique",
-                "description": "Render a specific prompt engineering technique template",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "technique": {"type": "string"},
-                        "variables": {"type": "object"}
-                    },
-                    "required": ["technique", "variables"]
-                }
-            }
-        ]
+            "required": ["chain_id"]
+        }
+    },
+    {
+        "name": "render_technique",
+        "description": "Render a specific prompt engineering technique template",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "technique": _STRING_SCHEMA,
+                "variables": _OBJECT_SCHEMA
+            },
+            "required": ["technique", "variables"]
+        }
+    }
+]
+
+_TOOLS_LIST_RESULT = orjson.dumps({"tools": MCP_TOOLS})
+
+# Each tool's inputSchema compiled once into generated Python code
+TOOL_VALIDATORS = {tool["name"]: fastjsonschema.compile(tool["inputSchema"]) for tool in MCP_TOOLS}
+
+@app.post("/mcp/tools/list")
+async def list_tools(request: ListRequest = Depends(rpc_body(ListRequest))):
+    """List available tools (MCP protocol)"""
+    return rpc_response_raw(request.id, _TOOLS_LIST_RESULT)
+
+# MCP tool handlers: each takes the tool arguments and returns the JSON-RPC result
+
+async def _tool_render_prompt(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Render a stored prompt template"""
+    template_name = arguments.get("template_name")
+    variables = arguments.get("variables", {})
+
+    if not template_name:
+        raise HTTPException(status_code=400, detail="template_name is required")
+
+    try:
+        rendered_content = await asyncio.to_thread(
+            data_manager.render_prompt_template, template_name, variables
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return {
+        "content": rendered_content,
+        "template_name": template_name,
+        "variables_used": variables
+    }
+
+async def _tool_create_prompt_template(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a prompt template"""
+    # Single validation pass through the request model
+    try:
+        template_request = PromptTemplateRequest.model_validate(arguments)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=f"Validation errors: {_format_validation_errors(e)}")
+
+    template_id = await asyncio.to_thread(
+        data_manager.create_prompt_template,
+        name=template_request.name,
+        description=template_request.description,
+        category=template_request.category,
+        template_content=template_request.template_content,
+        variables=template_request.variables,
+        created_by=template_request.created_by
+    )
+    invalidate_template_cache()
+
+    return {
+        "template_id": template_id,
+        "message": f"Template '{template_request.name}' created successfully"
+    }
+
+async def _tool_memory_be(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Store, retrieve or clear conversation memory"""
+    operation = arguments.get("operation")
+    conversation_id = arguments.get("conversation_id")
+    session_id = arguments.get("session_id", "default")
+    data = arguments.get("data", {})
+
+    if operation == "store":
+        memory_id = await asyncio.to_thread(
+            data_manager.store_memory_entry,
+            conversation_id=conversation_id,
+            session_id=session_id,
+            role=data.get("role", "user"),
+            content=data.get("content", ""),
+            entry_metadata=data.get("metadata", {})
+        )
+        return {
+            "memory_id": memory_id,
+            "message": "Memory entry stored successfully"
+        }
+
+    elif operation == "retrieve":
+        entries = await asyncio.to_thread(data_manager.retrieve_memory_entries, conversation_id)
+        return {
+            "entries": entries,
+            "count": len(entries)
+        }
+
+    elif operation == "clear":
+        await asyncio.to_thread(data_manager.clear_memory_entries, conversation_id)
+        return {
+            "message": "Memory entries cleared successfully"
+        }
+
+    raise HTTPException(status_code=400, detail=f"Unknown memory operation: {operation}")
+
+async def _tool_memory_fe(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Frontend view of session memory"""
+    action = arguments.get("action")
+    session_id = arguments.get("session_id")
+
+    if action == "get_history":
+        # For simplicity, use a default conversation ID
+        entries = await asyncio.to_thread(data_manager.retrieve_memory_entries, f"session_{session_id}")
+        return {
+            "history": entries,
+            "session_id": session_id
+        }
+
+    elif action == "save_context":
+        # This would typically save context, but simplified here
+        return {
+            "message": "Context saved successfully",
+            "session_id": session_id
+        }
+
+    raise HTTPException(status_code=400, detail=f"Unknown memory action: {action}")
+
+async def _tool_prompt_chain_be(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Start a prompt chain execution"""
+    chain_id = arguments.get("chain_id")
+    steps = arguments.get("steps", [])
 
+    if not chain_id:
+        raise HTTPException(status_code=400, detail="chain_id is required")
+
+    execution_id = await asyncio.to_thread(data_manager.execute_prompt_chain, chain_id, secrets.token_hex(16))
+
+    return {
+        "execution_id": execution_id,
+        "message": "Prompt chain execution started",
+        "steps_count": len(steps)
+    }
+
+async def _tool_prompt_chain_fe(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Report prompt chain status, optionally shaped for visualization"""
+    chain_id = arguments.get("chain_id")
+    visualize = arguments.get("visualize", False)
+
+    # Get chain status
+    status = await asyncio.to_thread(data_manager.get_prompt_chain_status, chain_id)
+
+    if visualize:
+        # Return visualization-friendly data
         return {
-            "jsonrpc": "2.0",
-            "id": request.get("id") if request else None,
-            "result": {
-                "tools": tools
+            "chain_id": chain_id,
+            "status": status,
+            "visualization": {
+                "total_steps": status["total_steps"],
+                "completed_steps": status["completed_steps"],
+                "failed_steps": status["failed_steps"],
+                "steps": status["steps"]
             }
         }
 
-    except Exception as e:
-        logger.error(f"Error listing tools: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "chain_id": chain_id,
+        "status": status
+    }
+
+async def _tool_render_technique(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Render a prompt engineering technique template"""
+    technique = arguments.get("technique")
+    variables = arguments.get("variables", {})
+
+    if not technique:
+        raise HTTPException(status_code=400, detail="technique is required")
 
-@app.post("/mcp/tools/call")
-async def call_tool(request: Dict[str, Any]):
-    """Call a tool (MCP protocol)"""
     try:
-        params = request.get("params", {})
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-
-        if tool_name == "render_prompt":
-            template_name = arguments.get("template_name")
-            variables = arguments.get("variables", {})
-
-            if not template_name:
-                raise HTTPException(status_code=400, detail="template_name is required")
-
-            try:
-                rendered_content = data_manager.render_prompt_template(template_name, variables)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "content": rendered_content,
-                        "template_name": template_name,
-                        "variables_used": variables
-                    }
-                }
-            except ValueError as e:
-                raise HTTPException(status_code=404, detail=str(e))
-
-        elif tool_name == "create_prompt_template":
-            required_fields = ["name", "description", "category", "template_content", "variables"]
-
-            if not all(field in arguments for field in required_fields):
-                raise HTTPException(status_code=400, detail=f"Missing required fields: {required_fields}")
-
-            # Validate the data
-            errors = DataValidator.validate_prompt_template_data(arguments)
-            if errors:
-                raise HTTPException(status_code=400, detail=f"Validation errors: {errors}")
-
-            template_id = data_manager.create_prompt_template(
-                name=arguments["name"],
-                description=arguments["description"],
-                category=arguments["category"],
-                template_content=arguments["template_content"],
-                variables=arguments["variables"],
-                created_by=arguments.get("created_by", "system")
-            )
+        rendered_content = render_technique(technique, variables)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "result": {
-                    "template_id": template_id,
-                    "message": f"Template '{arguments['name']}' created successfully"
-                }
-            }
+    return {
+        "technique": technique,
+        "content": rendered_content,
+        "variables_used": variables
+    }
 
-        elif tool_name == "memory_be":
-            operation = arguments.get("operation")
-            conversation_id = arguments.get("conversation_id")
-            session_id = arguments.get("session_id", "default")
-            data = arguments.get("data", {})
-
-            if operation == "store":
-                memory_id = data_manager.store_memory_entry(
-                    conversation_id=conversation_id,
-                    session_id=session_id,
-                    role=data.get("role", "user"),
-                    content=data.get("content", ""),
-                    metadata=data.get("metadata", {})
-                )
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "memory_id": memory_id,
-                        "message": "Memory entry stored successfully"
-                    }
-                }
-
-            elif operation == "retrieve":
-                entries = data_manager.retrieve_memory_entries(conversation_id)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "entries": entries,
-                        "count": len(entries)
-                    }
-                }
-
-            elif operation == "clear":
-                data_manager.clear_memory_entries(conversation_id)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "message": "Memory entries cleared successfully"
-                    }
-                }
-
-            else:
-                raise HTTPException(status_code=400, detail=f"Unknown memory operation: {operation}")
-
-        elif tool_name == "memory_fe":
-            action = arguments.get("action")
-            session_id = arguments.get("session_id")
-
-            if action == "get_history":
-                # For simplicity, use a default conversation ID
-                entries = data_manager.retrieve_memory_entries(f"session_{session_id}")
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "history": entries,
-                        "session_id": session_id
-                    }
-                }
-
-            elif action == "save_context":
-                # This would typically save context, but simplified here
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "message": "Context saved successfully",
-                        "session_id": session_id
-                    }
-                }
-
-            else:
-                raise HTTPException(status_code=400, detail=f"Unknown memory action: {action}")
-
-        elif tool_name == "prompt_chain_be":
-            chain_id = arguments.get("chain_id")
-            steps = arguments.get("steps", [])
-            inputs = arguments.get("inputs", {})
-
-            if not chain_id:
-                raise HTTPException(status_code=400, detail="chain_id is required")
-
-            execution_id = data_manager.execute_prompt_chain(chain_id, str(uuid.uuid4()))
-
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "result": {
-                    "execution_id": execution_id,
-                    "message": "Prompt chain execution started",
-                    "steps_count": len(steps)
-                }
-            }
+@lru_cache(maxsize=1024)
+def _render_technique_cached(technique: str, variables_key: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """Render a technique template once per distinct variable set; technique templates are static"""
+    return data_manager.render_technique_template(
+        technique, {name: value for name, _, value in variables_key}
+    )
 
-        elif tool_name == "prompt_chain_fe":
-            chain_id = arguments.get("chain_id")
-            visualize = arguments.get("visualize", False)
-
-            # Get chain status
-            status = data_manager.get_prompt_chain_status(chain_id)
-
-            if visualize:
-                # Return visualization-friendly data
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "chain_id": chain_id,
-                        "status": status,
-                        "visualization": {
-                            "total_steps": status["total_steps"],
-                            "completed_steps": status["completed_steps"],
-                            "failed_steps": status["failed_steps"],
-                            "steps": status["steps"]
-                        }
-                    }
-                }
-
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "result": {
-                    "chain_id": chain_id,
-                    "status": status
-                }
-            }
+# Variable sets larger than this (total characters) are rendered directly so the cache can't pin big outputs
+RENDER_CACHE_MAX_INPUT_CHARS = 4096
 
-        elif tool_name == "render_technique":
-            technique = arguments.get("technique")
-            variables = arguments.get("variables", {})
-
-            if not technique:
-                raise HTTPException(status_code=400, detail="technique is required")
-
-            try:
-                rendered_content = data_manager.render_technique_template(technique, variables)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": {
-                        "technique": technique,
-                        "content": rendered_content,
-                        "variables_used": variables
-                    }
-                }
-            except ValueError as e:
-                raise HTTPException(status_code=404, detail=str(e))
+def render_technique(technique: str, variables: Dict[str, Any]) -> str:
+    """Render a technique template, memoized when the variables are small and all values hashable"""
+    if sum(len(str(value)) for value in variables.values()) > RENDER_CACHE_MAX_INPUT_CHARS:
+        return data_manager.render_technique_template(technique, variables)
 
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown tool: {tool_name}")
+    # Keys keep insertion order because substitution is sequential, and include the value type
+    # so e.g. True and 1 don't share a cache entry
+    variables_key = tuple((name, type(value), value) for name, value in variables.items())
+    try:
+        return _render_technique_cached(technique, variables_key)
+    except TypeError:
+        return data_manager.render_technique_template(technique, variables)
+
+# Tool name -> handler, built once at import
+TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+    "render_prompt": _tool_render_prompt,
+    "create_prompt_template": _tool_create_prompt_template,
+    "memory_be": _tool_memory_be,
+    "memory_fe": _tool_memory_fe,
+    "prompt_chain_be": _tool_prompt_chain_be,
+    "prompt_chain_fe": _tool_prompt_chain_fe,
+    "render_technique": _tool_render_technique,
+}
+
+@app.post("/mcp/tools/call")
+async def call_tool(request: ToolCallRequest = Depends(rpc_body(ToolCallRequest))):
+    """Call a tool (MCP protocol)"""
+    try:
+        params = request.params
+        handler = TOOL_HANDLERS.get(params.name)
+
+        if handler is None:
+            raise HTTPException(status_code=400, detail=f"Unknown tool: {params.name}")
+
+        try:
+            TOOL_VALIDATORS[params.name](params.arguments)
+        except fastjsonschema.JsonSchemaException as e:
+            raise HTTPException(status_code=400, detail=f"Invalid arguments for {params.name}: {e.message}")
+
+        return rpc_response(request.id, await handler(params.arguments))
 
     except HTTPException:
         raise
@@ -498,41 +734,121 @@ async def call_tool(request: Dict[str, Any]):
         logger.error(f"Error calling tool: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# JSON-RPC method name -> MCP endpoint handler, shared by the batch endpoint
+MCP_METHOD_HANDLERS = {
+    "prompts/list": (ListRequest, list_prompts),
+    "prompts/get": (PromptGetRequest, get_prompt),
+    "tools/list": (ListRequest, list_tools),
+    "tools/call": (ToolCallRequest, call_tool),
+}
+
+async def _dispatch_rpc(raw_request: Any) -> Optional[bytes]:
+    """Dispatch a single JSON-RPC request and return its encoded response
+
+    Returns None for a notification: a well-formed request without an "id"
+    member. Entries that fail validation are always answered.
+    """
+    if not isinstance(raw_request, dict):
+        return rpc_error_body(None, JSONRPC_INVALID_REQUEST, "Invalid request: expected a JSON object")
+
+    method = raw_request.get("method")
+    entry = MCP_METHOD_HANDLERS.get(method) if isinstance(method, str) else None
+    model = entry[0] if entry else JsonRpcRequest
+
+    try:
+        request = _RPC_ADAPTERS[model].validate_python(raw_request)
+    except ValidationError as e:
+        in_params = all(err["loc"][:1] == ("params",) for err in e.errors())
+        return rpc_error_body(
+            raw_request.get("id"),
+            JSONRPC_INVALID_PARAMS if in_params else JSONRPC_INVALID_REQUEST,
+            f"Invalid request: {_format_validation_errors(e)}",
+        )
+
+    request_id = request.id
+    is_notification = "id" not in raw_request
+
+    if entry is None:
+        if is_notification:
+            return None
+        return rpc_error_body(
+            request_id, JSONRPC_METHOD_NOT_FOUND, f"Unknown method: {request.method}"
+        )
+
+    handler = entry[1]
+    try:
+        response = await handler(request)
+        body = response.body
+    except HTTPException as e:
+        code = JSONRPC_INTERNAL_ERROR if e.status_code >= 500 else JSONRPC_INVALID_PARAMS
+        body = rpc_error_body(request_id, code, str(e.detail))
+    return None if is_notification else body
+
+# Entries per batch; each one runs concurrently on the shared DB thread pool
+MAX_BATCH_SIZE = int(os.getenv("MCP_MAX_BATCH_SIZE", "50"))
+
+@app.post("/mcp/batch")
+async def batch_requests(requests: List[Any]):
+    """Handle a JSON-RPC 2.0 batch of MCP requests concurrently"""
+    if not requests:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one request")
+    if len(requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413, detail=f"Batch exceeds the maximum of {MAX_BATCH_SIZE} requests"
+        )
+
+    bodies = await asyncio.gather(*(_dispatch_rpc(request) for request in requests))
+    # Notifications are executed but get no response
+    bodies = [body for body in bodies if body is not None]
+    if not bodies:
+        return Response(status_code=204)
+    return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+
 # Additional REST API endpoints for management
 
+# Number of templates encoded per chunk when streaming /api/prompts
+TEMPLATE_STREAM_CHUNK_SIZE = 100
+
+def _template_summary(template) -> Dict[str, Any]:
+    """Serialize a prompt template for the REST listing"""
+    return {
+        "id": template.id,
+        "name": template.name,
+        "description": template.description,
+        "category": template.category,
+        "variables": template.variables,
+        "created_at": template.created_at.isoformat() if template.created_at else None,
+        "updated_at": template.updated_at.isoformat() if template.updated_at else None
+    }
+
+async def _stream_templates(templates: List[Any]):
+    """Yield the templates listing as JSON, encoding one chunk of templates at a time"""
+    yield b'{"templates":['
+    for start in range(0, len(templates), TEMPLATE_STREAM_CHUNK_SIZE):
+        chunk = templates[start:start + TEMPLATE_STREAM_CHUNK_SIZE]
+        encoded = b",".join(orjson.dumps(_template_summary(template)) for template in chunk)
+        yield encoded if start == 0 else b"," + encoded
+    yield b"]}"
+
 @app.get("/api/prompts")
 async def get_prompts(category: Optional[str] = None):
     """Get all prompt templates"""
     try:
-        templates = data_manager.get_templates_by_category(category) if category else data_manager.list_templates()
-        return {
-            "templates": [
-                {
-                    "id": template.id,
-                    "name": template.name,
-                    "description": template.description,
-                    "category": template.category,
-                    "variables": template.variables,
-                    "created_at": template.created_at.isoformat() if template.created_at else None,
-                    "updated_at": template.updated_at.isoformat() if template.updated_at else None
-                }
-                for template in templates
-            ]
-        }
+        if category:
+            templates = await asyncio.to_thread(data_manager.get_templates_by_category, category)
+        else:
+            templates = await get_cached_templates()
+        return StreamingResponse(_stream_templates(templates), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting prompts: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/prompts")
-async def create_prompt_template(request: PromptTemplateRequest):
+@app.post("/api/prompts", openapi_extra=json_body_openapi(PromptTemplateRequest))
+async def create_prompt_template(request: PromptTemplateRequest = Depends(json_body(PromptTemplateRequest))):
     """Create a new prompt template"""
     try:
-        # Validate the request
-        errors = DataValidator.validate_prompt_template_data(request.dict())
-        if errors:
-            raise HTTPException(status_code=400, detail=f"Validation errors: {errors}")
-
-        template_id = data_manager.create_prompt_template(
+        template_id = await asyncio.to_thread(
+            data_manager.create_prompt_template,
             name=request.name,
             description=request.description,
             category=request.category,
@@ -540,33 +856,67 @@ async def create_prompt_template(request: PromptTemplateRequest):
             variables=request.variables,
             created_by=request.created_by
         )
+        invalidate_template_cache()
 
-        return {
+        return ORJSONResponse({
             "id": template_id,
             "message": f"Template '{request.name}' created successfully"
-        }
+        })
 
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Error creating prompt template: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _parse_render_variables(variables: str) -> Dict[str, Any]:
+    """Parse render variables from a JSON object or a legacy query string"""
+    if variables.lstrip().startswith("{"):
+        try:
+            parsed = orjson.loads(variables)
+        except orjson.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid variables JSON: {e}")
+        if not isinstance(parsed, dict):
+            raise HTTPException(status_code=400, detail="Variables must be a JSON object")
+        return parsed
+
+    return dict(urllib.parse.parse_qsl(variables))
+
 @app.get("/api/prompts/{template_name}/render")
 async def render_prompt_template(template_name: str, variables: str):
     """Render a prompt template with variables"""
     try:
-        # Parse variables from query string
-        import urllib.parse
-        variables_dict = dict(urllib.parse.parse_qsl(variables))
+        variables_dict = _parse_render_variables(variables)
 
-        rendered_content = data_manager.render_prompt_template(template_name, variables_dict)
+        rendered_content = await asyncio.to_thread(
+            data_manager.render_prompt_template, template_name, variables_dict
+        )
 
-        return {
+        return ORJSONResponse({
             "template_name": template_name,
             "variables": variables_dict,
             "rendered_content": rendered_content
-        }
+        })
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error rendering prompt template: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/prompts/render", openapi_extra=json_body_openapi(PromptRenderRequest))
+async def render_prompt_template_body(request: PromptRenderRequest = Depends(json_body(PromptRenderRequest))):
+    """Render a prompt template with typed variables from a JSON body"""
+    try:
+        rendered_content = await asyncio.to_thread(
+            data_manager.render_prompt_template, request.template_name, request.variables
+        )
+
+        return ORJSONResponse({
+            "template_name": request.template_name,
+            "variables": request.variables,
+            "rendered_content": rendered_content
+        })
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -578,8 +928,8 @@ async def render_prompt_template(template_name: str, variables: str):
 async def get_categories():
     """Get all available prompt categories"""
     try:
-        categories = data_manager.get_available_categories()
-        return {"categories": categories}
+        categories = await asyncio.to_thread(data_manager.get_available_categories)
+        return ORJSONResponse({"categories": categories})
     except Exception as e:
         logger.error(f"Error getting categories: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -588,21 +938,54 @@ async def get_categories():
 async def get_usage_statistics():
     """Get usage statistics"""
     try:
-        stats = data_manager.get_usage_statistics()
+        stats = await get_cached_usage_statistics()
         return {"statistics": stats}
     except Exception as e:
         logger.error(f"Error getting statistics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Error handling
+# Pre-encoded bodies for the fixed error messages only; details that embed user input are encoded per error
+_STATIC_ERROR_BODIES: Dict[str, bytes] = {
+    detail: orjson.dumps({"detail": detail})
+    for detail in (
+        "Not Found",
+        "Method Not Allowed",
+        "template_name is required",
+        "chain_id is required",
+        "technique is required",
+        "Batch must contain at least one request",
+        "Variables must be a JSON object",
+    )
+}
+
+def _http_error_body(detail: str) -> bytes:
+    """Encode an error envelope, reusing the pre-encoded body for fixed messages"""
+    body = _STATIC_ERROR_BODIES.get(detail)
+    return body if body is not None else orjson.dumps({"detail": detail})
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request, exc):
+    """Render HTTP errors from cached bytes instead of FastAPI's jsonable_encoder path"""
+    if exc.status_code in (204, 304) or exc.status_code < 200:
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    if isinstance(exc.detail, str):
+        return Response(
+            content=_http_error_body(exc.detail),
+            status_code=exc.status_code,
+            headers=exc.headers,
+            media_type="application/json",
+        )
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
     logger.error(f"Global exception handler: {exc}", exc_info=True)
-    return {
+    return ORJSONResponse(status_code=500, content={
         "error": "Internal server error",
         "detail": str(exc)
-    }
+    })
 
 
 def create_app() -> FastAPI:
@@ -620,10 +1003,17 @@ if __name__ == "__main__":
     logger.info("  - REST API: /api/*")
     logger.info("  - Health Check: /health")
 
+    # Reload is opt-in for development (MCP_RELOAD=1); otherwise run WEB_CONCURRENCY processes,
+    # the same count the DB pool size is derived from. uvicorn's default "auto" loop/http pick
+    # uvloop and httptools when installed
+    reload = os.getenv("MCP_RELOAD", "0") == "1"
+    workers = 1 if reload else get_settings().web_concurrency
+
     uvicorn.run(
         "mcp_pba_tunnel.server.fastapi_mcp_server:app",
         host="0.0.0.0",
         port=9001,
-        reload=True,
+        reload=reload,
+        workers=workers,
         log_level="info"
     )
@@ -2,3 +2,15 @@
 """
 Utility functions for MCP-PBA-TUNNEL
 """
+
+from uuid import UUID
+
+from uuid_utils.compat import uuid7
+
+
+def new_id() -> UUID:
+    """Generate a time-ordered UUIDv7 primary key (Rust-backed, index-friendly)"""
+    return uuid7()
+
+
+__all__ = ["new_id"]
@@ -4,20 +4,23 @@ Setup script for MCP-PBA-TUNNEL
 Installs dependencies and configures the environment
 """
 
+import importlib
 import os
+import shlex
 import sys
 import subprocess
 from pathlib import Path
 
 def run_command(command, description):
-    """Run a shell command and handle errors"""
+    """Run a command without a shell, streaming its output, and handle errors"""
     print(f"🔧 {description}")
+    args = command if isinstance(command, list) else shlex.split(command)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(args, check=True)
         print(f"✅ {description} completed")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e.stderr}")
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"❌ {description} failed: {e}")
         return False
 
 def main():
@@ -34,7 +37,10 @@ def main():
     print(f"✅ Python {python_version.major}.{python_version.minor}.{python_version.micro} detected")
 
     # Install Python dependencies
-    if not run_command("pip install -r requirements.txt", "Installing Python dependencies"):
+    if not run_command(
+        [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+        "Installing Python dependencies"
+    ):
         sys.exit(1)
 
     # Create data directory
@@ -45,10 +51,13 @@ def main():
     # Initialize database
     print("🔧 Initializing database...")
     try:
-        result = subprocess.run([sys.executable, "-c", "from mcp_pba_tunnel.data.project_manager import DatabaseManager; db = DatabaseManager(); print('✅ Database initialized')"], check=True, capture_output=True, text=True)
+        # Pick up packages installed above without restarting the interpreter
+        importlib.invalidate_caches()
+        from mcp_pba_tunnel.data.project_manager import DatabaseManager
+        DatabaseManager()
         print("✅ Database initialized")
-    except subprocess.CalledProcessError as e:
-        print(f"⚠️  Database initialization failed: {e.stderr}")
+    except Exception as e:
+        print(f"⚠️  Database initialization failed: {e}")
         print("   This is normal if you haven't set up the database yet")
 
     print("\n" + "=" * 50)
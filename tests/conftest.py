@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Shared test setup for MCP-PBA-TUNNEL
+
+The server module builds its data manager at import time, which connects to
+PostgreSQL. An in-memory data manager is installed first so the HTTP tests run
+without a database.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from mcp_pba_tunnel.data import project_manager
+from mcp_pba_tunnel.data.models import PromptTemplate
+from mcp_pba_tunnel.utils import new_id
+
+
+class InMemoryDataManager(project_manager.PromptDataManager):
+    """PromptDataManager keeping templates and memory in dicts instead of PostgreSQL
+
+    Only methods the real class defines are overridden, so the server is exercised
+    against the production interface.
+    """
+
+    def __init__(self):
+        self.templates: Dict[str, PromptTemplate] = {}
+        self.memory: Dict[str, List[Dict[str, Any]]] = {}
+        self.create_prompt_template(
+            name="business_logic_implementation",
+            description="Implement business logic with proper validation",
+            category="development",
+            template_content="Implement {{business_domain}} logic for {{requirements}}",
+            variables=["business_domain", "requirements"]
+        )
+
+    def create_prompt_template(self, name: str, description: str, category: str, template_content: str,
+                               variables: List[str], created_by: str = "system") -> str:
+        template = PromptTemplate(
+            name=name,
+            description=description,
+            category=category,
+            template_content=template_content,
+            variables=variables,
+            created_by=created_by
+        )
+        self.templates[name] = template
+        return str(template.id)
+
+    def get_template_by_name(self, name: str) -> Optional[PromptTemplate]:
+        return self.templates.get(name)
+
+    def list_templates(self, category: Optional[str] = None) -> List[PromptTemplate]:
+        return [t for t in self.templates.values() if category is None or t.category == category]
+
+    def get_templates_by_category(self, category: str) -> List[PromptTemplate]:
+        return self.list_templates(category)
+
+    def get_available_categories(self) -> List[str]:
+        return sorted({t.category for t in self.templates.values()})
+
+    def render_prompt_template(self, template_name: str, variables: Dict[str, Any]) -> str:
+        template = self.templates.get(template_name)
+        if not template:
+            raise ValueError(f"Template not found: {template_name}")
+
+        content = template.template_content
+        for var_name, var_value in variables.items():
+            if var_name in template.variables:
+                content = content.replace(f"{{{{{var_name}}}}}", str(var_value))
+        return content
+
+    def get_usage_statistics(self) -> Dict[str, Any]:
+        return {"total_templates": len(self.templates), "usage": []}
+
+    def store_memory_entry(self, conversation_id: str, session_id: str, role: str, content: str,
+                           entry_metadata: Optional[Dict[str, Any]] = None, ttl_seconds: int = 3600) -> str:
+        entry_id = str(new_id())
+        self.memory.setdefault(conversation_id, []).append({
+            "id": entry_id,
+            "session_id": session_id,
+            "role": role,
+            "content": content,
+            "entry_metadata": entry_metadata or {}
+        })
+        return entry_id
+
+    def retrieve_memory_entries(self, conversation_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        return self.memory.get(conversation_id, [])[:limit]
+
+    def clear_memory_entries(self, conversation_id: str) -> int:
+        return len(self.memory.pop(conversation_id, []))
+
+
+# get_data_manager() returns the module-level instance when one is set
+project_manager._data_manager = InMemoryDataManager()